@@ -5,45 +5,294 @@ This module provides functionality to collect historical air pollution data from
 and store it in BigQuery.
 """
 
+import io
+import json
 import os
-from datetime import datetime, timedelta
+import uuid
+import warnings
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, tzinfo
+from functools import lru_cache
 from typing import Optional
+from zoneinfo import ZoneInfo
 
+import orjson
 import pandas as pd
-import pytz
+import pyarrow as pa
+import pyarrow.parquet as pq
 import requests
+from geopy.extra.rate_limiter import RateLimiter
 from geopy.geocoders import Nominatim
-from google.cloud import bigquery
+from google.cloud import bigquery, bigquery_storage_v1
+from google.cloud.bigquery_storage_v1 import types, writer
+from google.protobuf import descriptor_pb2, descriptor_pool, message_factory
+from requests.adapters import HTTPAdapter
 from timezonefinder import TimezoneFinder
-
-from src.utils.bq_utils import BQ_CONFIG, load_environment
+from urllib3.util.retry import Retry
+
+from src.utils.bq_utils import BQ_CONFIG, PROJECT_ROOT, load_environment
+
+
+UTC = ZoneInfo("UTC")
+
+# Flattened OpenWeatherMap response keys mapped to our column names
+_OWM_RENAME = {
+    "dt": "timestamp",
+    "main.aqi": "aqi",
+    "components.co": "co",
+    "components.no": "no",
+    "components.no2": "no2",
+    "components.o3": "o3",
+    "components.so2": "so2",
+    "components.pm2_5": "pm2_5",
+    "components.pm10": "pm10",
+    "components.nh3": "nh3",
+}
+
+# Column dtypes for parsed readings: AQI is a 1-5 index, so a nullable 8-bit
+# integer holds it exactly; concentrations stay float64 to match FLOAT64 columns
+_NUMERIC_DTYPES = {
+    "aqi": "Int8",
+    "co": "float64",
+    "no": "float64",
+    "no2": "float64",
+    "o3": "float64",
+    "so2": "float64",
+    "pm2_5": "float64",
+    "pm10": "float64",
+    "nh3": "float64",
+}
+
+# BigQuery schema for the pollution table, built once from configuration
+_BQ_SCHEMA = [
+    bigquery.SchemaField(
+        name=field["name"],
+        field_type=field["type"],
+        mode=field.get("mode", "NULLABLE"),
+        description=field.get("description", ""),
+    )
+    for field in BQ_CONFIG["table"]["schema"]
+]
+
+# On-disk cache of geocoding results, keyed on normalized city name
+_GEOCODE_CACHE_PATH = PROJECT_ROOT / "cache" / "geocodes.json"
+
+# Arrow types used when serializing DataFrames for BigQuery load jobs
+_ARROW_TYPES = {
+    "STRING": pa.string(),
+    "TIMESTAMP": pa.timestamp("us", tz="UTC"),
+    "INTEGER": pa.int64(),
+    "FLOAT64": pa.float64(),
+}
+
+# Protobuf types used when streaming rows through the Storage Write API;
+# TIMESTAMP values are sent as microseconds since the epoch
+_PROTO_TYPES = {
+    "STRING": descriptor_pb2.FieldDescriptorProto.TYPE_STRING,
+    "TIMESTAMP": descriptor_pb2.FieldDescriptorProto.TYPE_INT64,
+    "INTEGER": descriptor_pb2.FieldDescriptorProto.TYPE_INT64,
+    "FLOAT64": descriptor_pb2.FieldDescriptorProto.TYPE_DOUBLE,
+}
+
+# Python converters applied to each value before it is set on a proto row
+_PROTO_CONVERTERS = {
+    "STRING": str,
+    "TIMESTAMP": int,
+    "INTEGER": int,
+    "FLOAT64": float,
+}
+
+# Decimal places kept when caching timezone lookups (0.01° is about 1 km)
+TIMEZONE_PRECISION = 2
+
+# Batches up to this size are streamed; larger ones use a load job
+STREAMING_MAX_ROWS = 10_000
+
+# Number of rows sent per AppendRowsRequest
+STREAMING_CHUNK_ROWS = 1_000
+
+
+def _chunk_ranges(start: datetime, end: datetime, days: int):
+    """Split [start, end] into consecutive (start, end) windows of at most `days`."""
+    step = timedelta(days=days)
+    chunk_start = start
+    while chunk_start < end:
+        chunk_end = min(chunk_start + step, end)
+        yield chunk_start, chunk_end
+        chunk_start = chunk_end
+
+
+def _row_message(schema):
+    """
+    Build the protobuf row message matching a BigQuery table schema.
+
+    Args:
+        schema (list): BigQuery schema fields for the destination table
+
+    Returns:
+        tuple: (DescriptorProto describing the row, generated message class)
+    """
+    file_proto = descriptor_pb2.FileDescriptorProto(
+        name="air_pollution_row.proto", package="air_pollution", syntax="proto2"
+    )
+    row_proto = file_proto.message_type.add(name="AirPollutionRow")
+    for number, field in enumerate(schema, 1):
+        row_proto.field.add(
+            name=field.name,
+            number=number,
+            type=_PROTO_TYPES[field.field_type],
+            label=descriptor_pb2.FieldDescriptorProto.LABEL_OPTIONAL,
+        )
+    pool = descriptor_pool.DescriptorPool()
+    pool.Add(file_proto)
+    descriptor = pool.FindMessageTypeByName("air_pollution.AirPollutionRow")
+    if hasattr(message_factory, "GetMessageClass"):
+        row_class = message_factory.GetMessageClass(descriptor)
+    else:
+        row_class = message_factory.MessageFactory(pool).GetPrototype(descriptor)
+    return row_proto, row_class
+
+
+def _serialize_rows(df: pd.DataFrame, row_class, schema) -> list[bytes]:
+    """
+    Serialize DataFrame rows into protobuf messages for the Storage Write API.
+
+    Timestamps are sent as microseconds since the epoch regardless of the
+    resolution pandas stores them in; missing values are left unset so they
+    load as NULL.
+
+    Args:
+        df (pandas.DataFrame): Rows to serialize, with a tz-aware timestamp column
+        row_class (type): Message class from _row_message
+        schema (list): BigQuery schema fields for the destination table
+
+    Returns:
+        list: Serialized row messages
+    """
+    converters = {
+        field.name: _PROTO_CONVERTERS[field.field_type] for field in schema
+    }
+    timestamps_us = df["timestamp"].dt.tz_convert(UTC).dt.as_unit("us")
+    records = df.assign(
+        timestamp=timestamps_us.astype("int64")
+    )[list(converters)].to_dict("records")
+    return [
+        row_class(**{
+            name: converters[name](value)
+            for name, value in record.items()
+            if pd.notna(value)
+        }).SerializeToString()
+        for record in records
+    ]
+
+
+@lru_cache(maxsize=8192)
+def _timezone_at(tf: TimezoneFinder, lat: float, lon: float) -> Optional[str]:
+    """
+    Look up the timezone name for coordinates, memoized across calls.
+
+    Callers pass coordinates rounded to TIMEZONE_PRECISION decimal places,
+    since timezone boundaries do not move at that scale.
+    """
+    return tf.timezone_at(lat=lat, lng=lon)
 
 
 class AirPollutionCollector:
     """A class to collect and store historical air pollution data for cities."""
 
+    # Geocoding results keyed on normalized city name, shared across instances
+    # and loaded from disk on first use
+    _geo_cache: Optional[dict[str, tuple[float, float]]] = None
+    _geo_cache_dirty = False
+
+    # Geocoder with our app's user agent, throttled to Nominatim's usage policy
+    _geolocator = Nominatim(user_agent="air_pollution_app")
+    _geocode = RateLimiter(_geolocator.geocode, min_delay_seconds=1)
+
+    # TimezoneFinder loads its polygon data on construction, so share one
+    _tf_instance: Optional[TimezoneFinder] = None
+
     def __init__(self):
         """Initialize the collector with configuration."""
         load_environment()
         self.api_key = os.getenv("OPENWEATHERMAP_API_KEY")
         self.base_url = "http://api.openweathermap.org/data/2.5/air_pollution/history"
-        self.tf = TimezoneFinder()  # Initialize TimezoneFinder
+        # Shared HTTP session so API calls reuse connections and retry
+        # transient failures with backoff
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=(429, 500, 502, 503, 504),
+            ),
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        # BigQuery client and target table, reused across saves
+        self.client = bigquery.Client()
+        self.table_id = (
+            f"{self.client.project}.{BQ_CONFIG['dataset']['id']}.{BQ_CONFIG['table']['id']}"
+        )
+        # Storage Write API client, created on first streamed save
+        self._write_client = None
+        # Storage Read API client, created on first query download
+        self._read_client = None
+
+    @classmethod
+    def _tf(cls) -> TimezoneFinder:
+        """Return the shared TimezoneFinder, creating it on first use."""
+        if cls._tf_instance is None:
+            cls._tf_instance = TimezoneFinder()
+        return cls._tf_instance
+
+    @classmethod
+    def _load_geo_cache(cls) -> dict[str, tuple[float, float]]:
+        """Return the geocoding cache, reading it from disk on first use."""
+        if cls._geo_cache is None:
+            try:
+                with open(_GEOCODE_CACHE_PATH, "r", encoding="utf-8") as f:
+                    cls._geo_cache = {
+                        key: tuple(coords) for key, coords in json.load(f).items()
+                    }
+            except (FileNotFoundError, json.JSONDecodeError):
+                cls._geo_cache = {}
+        return cls._geo_cache
+
+    @classmethod
+    def _save_geo_cache(cls):
+        """Atomically write the geocoding cache to disk if it has new entries."""
+        if not cls._geo_cache_dirty:
+            return
+        _GEOCODE_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = _GEOCODE_CACHE_PATH.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(cls._geo_cache, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, _GEOCODE_CACHE_PATH)
+        cls._geo_cache_dirty = False
 
     def get_coordinates(self, city):
         """Get latitude and longitude coordinates for a city using geocoding."""
-        # Initialize geocoder with our app's user agent
-        geolocator = Nominatim(user_agent="air_pollution_app")
+        # Serve repeat lookups from the cache
+        cache = self._load_geo_cache()
+        key = city.strip().casefold()
+        if key in cache:
+            return cache[key]
 
         try:
             # Attempt to geocode the city name
-            location = geolocator.geocode(city)
+            location = self._geocode(city)
             if location:
-                return location.latitude, location.longitude
+                cache[key] = (location.latitude, location.longitude)
+                type(self)._geo_cache_dirty = True
+                return cache[key]
             raise ValueError(f"Could not find coordinates for {city}")
         except Exception as e:
             raise ValueError(f"Error getting coordinates: {str(e)}")
 
-    def get_timezone(self, lat: float, lon: float) -> pytz.timezone:
+    def get_timezone(self, lat: float, lon: float) -> tzinfo:
         """
         Get timezone for given coordinates.
 
@@ -52,32 +301,42 @@ class AirPollutionCollector:
             lon (float): Longitude
 
         Returns:
-            pytz.timezone: Timezone object for the location
+            tzinfo: Timezone object for the location
         """
-        # Get timezone string for coordinates
-        timezone_str = self.tf.timezone_at(lat=lat, lng=lon)
+        # Get timezone string for coordinates (rounded so nearby points share a cache entry)
+        timezone_str = _timezone_at(
+            self._tf(),
+            round(lat, TIMEZONE_PRECISION),
+            round(lon, TIMEZONE_PRECISION),
+        )
         if not timezone_str:
             # Default to UTC if timezone not found
             print(f"Warning: Could not find timezone for coordinates ({lat}, {lon}). Using UTC.")
-            return pytz.UTC
+            return UTC
         
-        return pytz.timezone(timezone_str)
+        return ZoneInfo(timezone_str)
 
-    def convert_timestamp(self, timestamp: int, timezone: pytz.timezone) -> datetime:
+    def convert_timestamp(self, timestamp: int, timezone: tzinfo) -> datetime:
         """
         Convert Unix timestamp to datetime in specified timezone.
 
+        Deprecated: parse_pollution_data converts timestamps in bulk with
+        pd.to_datetime; this is kept only for scalar callers.
+
         Args:
             timestamp (int): Unix timestamp in UTC
-            timezone (pytz.timezone): Target timezone
+            timezone (tzinfo): Target timezone
 
         Returns:
             datetime: Localized datetime object
         """
-        # Convert Unix timestamp to UTC datetime
-        utc_dt = datetime.fromtimestamp(timestamp, pytz.UTC)
-        # Convert to target timezone
-        return utc_dt.astimezone(timezone)
+        warnings.warn(
+            "convert_timestamp is deprecated; use pd.to_datetime(..., unit='s', "
+            "utc=True).tz_convert(timezone) for bulk conversion.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return pd.Timestamp(timestamp, unit="s", tz=UTC).tz_convert(timezone).to_pydatetime()
 
     def get_pollution_data(self, lat, lon, start_date, end_date):
         """
@@ -109,52 +368,51 @@ class AirPollutionCollector:
         }
 
         try:
-            # Make API request with timeout
-            response = requests.get(self.base_url, params=params, timeout=300)
+            # Make API request with timeout (transient failures are retried)
+            response = self._session.get(self.base_url, params=params, timeout=30)
             response.raise_for_status()  # Raise exception for bad status codes
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            return orjson.loads(response.content)
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             raise Exception(f"Error fetching pollution data: {str(e)}")
 
-    def parse_pollution_data(self, data: dict, city: str, timezone: pytz.timezone) -> pd.DataFrame:
+    def parse_pollution_data(
+        self,
+        data: dict,
+        city: str,
+        timezone: tzinfo,
+        start: Optional[datetime] = None
+    ) -> pd.DataFrame:
         """
         Parse API response data into a pandas DataFrame and ensure hourly completeness.
 
         Args:
             data (dict): Raw API response data
             city (str): City name to include in the records
-            timezone (pytz.timezone): Timezone for the city
+            timezone (tzinfo): Timezone for the city
+            start (datetime, optional): Timezone-aware start of the requested
+                range; hours from here up to the first reading are filled too
 
         Returns:
             pandas.DataFrame: Parsed pollution data with complete hourly timestamps
         """
-        records = []
-
-        # Parse API response
-        for item in data["list"]:
-            local_dt = self.convert_timestamp(item["dt"], timezone)
-            record = {
-                "city": city,
-                "timestamp": local_dt,
-                "aqi": item["main"]["aqi"],
-                "co": item["components"]["co"],
-                "no": item["components"]["no"],
-                "no2": item["components"]["no2"],
-                "o3": item["components"]["o3"],
-                "so2": item["components"]["so2"],
-                "pm2_5": item["components"]["pm2_5"],
-                "pm10": item["components"]["pm10"],
-                "nh3": item["components"]["nh3"],
-            }
-            records.append(record)
-
-        # Convert to DataFrame
-        df = pd.DataFrame(records)
+        # Flatten API response in bulk
+        df = pd.json_normalize(data["list"])
         if df.empty:
             return df
 
+        # Keep known fields and convert timestamps in one pass
+        df = df[list(_OWM_RENAME)].rename(columns=_OWM_RENAME)
+        df["timestamp"] = pd.to_datetime(
+            df["timestamp"], unit="s", utc=True
+        ).dt.tz_convert(timezone)
+        df.insert(0, "city", city)
+
         # Generate complete hourly sequence
         min_time = df["timestamp"].min()
+        if start is not None:
+            # Hours the API skipped at the start of the range are missing too
+            first_hour = pd.Timestamp(start).tz_convert(UTC).ceil("h")
+            min_time = min(min_time, first_hour.tz_convert(timezone))
         max_time = df["timestamp"].max()
         complete_hours = pd.date_range(
             start=min_time,
@@ -163,216 +421,467 @@ class AirPollutionCollector:
             tz=timezone
         )
 
-        # Create template DataFrame with all hours
-        template = pd.DataFrame({
-            "timestamp": complete_hours,
-            "city": city
-        })
-
-        # Merge with actual data
-        df = pd.merge(
-            template,
-            df,
-            on=["city", "timestamp"],
-            how="left"
+        # Align records onto the complete hourly index
+        df = (
+            df.drop_duplicates(subset="timestamp")
+            .set_index("timestamp")
+            .reindex(complete_hours)
         )
+        df["city"] = city
+        df.index.name = "timestamp"
+        df = df.reset_index()
 
-        # Initialize numeric columns with explicit null values
-        numeric_columns = ["aqi", "co", "no", "no2", "o3", "so2", "pm2_5", "pm10", "nh3"]
-        for col in numeric_columns:
-            if col not in df.columns:
-                df[col] = None
-            else:
-                df[col] = df[col].astype('float64')
-                df[col] = df[col].where(df[col].notna(), None)
+        # Cast numeric columns to compact types; missing hours stay null and load as NULL
+        df = df.astype(_NUMERIC_DTYPES)
 
         return df
 
-    def check_existing_records(self, client, table_ref, city, start_date, end_date):
+    def _bqstorage_read_client(self):
         """
-        Check for existing records in the given date range.
+        Return the shared Storage Read API client, creating it on first use.
+
+        Returns:
+            bigquery_storage_v1.BigQueryReadClient: Client used to download
+            query results as Arrow record batches
+        """
+        if self._read_client is None:
+            self._read_client = bigquery_storage_v1.BigQueryReadClient()
+        return self._read_client
+
+    def _latest_timestamps(self, client, table_ref, cities):
+        """
+        Get the most recent stored timestamp for each city.
 
         Args:
             client (bigquery.Client): BigQuery client
             table_ref (str): Full table reference
-            city (str): City name
-            start_date (datetime): Start date
-            end_date (datetime): End date
+            cities (list): City names
+
+        Returns:
+            pandas.Series: Latest timestamp indexed by city; cities without
+            stored data are absent
+        """
+        query = f"""
+            SELECT city, MAX(timestamp) AS latest
+            FROM `{table_ref}`
+            WHERE city IN UNNEST(@cities)
+            GROUP BY city
+        """
+
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=[
+                bigquery.ArrayQueryParameter("cities", "STRING", cities),
+            ]
+        )
+
+        latest = client.query(query, job_config=job_config).to_dataframe(
+            bqstorage_client=self._bqstorage_read_client()
+        )
+        return latest.set_index("city")["latest"]
+
+    def check_existing_records(self, client, table_ref, df):
+        """
+        Check which of the given records already exist in BigQuery.
+
+        Only the candidate cities and timestamps are sent to BigQuery, so the
+        result is bounded by the overlap with the new data rather than by the
+        size of the stored history.
+
+        Args:
+            client (bigquery.Client): BigQuery client
+            table_ref (str): Full table reference
+            df (pandas.DataFrame): New pollution data
 
         Returns:
-            set: Set of (city, timestamp) tuples for existing records
+            pandas.MultiIndex: (city, timestamp) pairs for existing records
         """
-        # Query to get existing records
+        # Query only the timestamps we are about to write
         query = f"""
             SELECT city, timestamp
             FROM `{table_ref}`
-            WHERE city = @city
-            AND timestamp BETWEEN @start_date AND @end_date
+            WHERE city IN UNNEST(@cities)
+            AND timestamp IN UNNEST(@timestamps)
         """
 
         # Configure query parameters
         job_config = bigquery.QueryJobConfig(
             query_parameters=[
-                bigquery.ScalarQueryParameter("city", "STRING", city),
-                bigquery.ScalarQueryParameter("start_date", "TIMESTAMP", start_date),
-                bigquery.ScalarQueryParameter("end_date", "TIMESTAMP", end_date),
+                bigquery.ArrayQueryParameter(
+                    "cities", "STRING", df["city"].unique().tolist()
+                ),
+                bigquery.ArrayQueryParameter(
+                    "timestamps", "TIMESTAMP", df["timestamp"].unique().tolist()
+                ),
             ]
         )
 
-        # Execute query and convert results to set of tuples
-        df = client.query(query, job_config=job_config).to_dataframe()
-        return set(zip(df["city"], df["timestamp"]))
+        # Execute query and index results by (city, timestamp)
+        existing = client.query(query, job_config=job_config).to_dataframe(
+            bqstorage_client=self._bqstorage_read_client()
+        )
+        return pd.MultiIndex.from_frame(existing[["city", "timestamp"]])
+
+    def _load_dataframe(self, client, df, table_id, schema, write_disposition):
+        """
+        Load a DataFrame into BigQuery as a Snappy-compressed Parquet file.
+
+        Args:
+            client (bigquery.Client): BigQuery client
+            df (pandas.DataFrame): DataFrame to load
+            table_id (str): Full destination table ID
+            schema (list): BigQuery schema fields for the destination table
+            write_disposition (str): BigQuery write disposition
+        """
+        # Serialize to Parquet with column types matching the table schema
+        arrow_schema = pa.schema(
+            [(field.name, _ARROW_TYPES[field.field_type]) for field in schema]
+        )
+        table = pa.Table.from_pandas(
+            df[arrow_schema.names], schema=arrow_schema, preserve_index=False
+        )
+        buffer = io.BytesIO()
+        pq.write_table(table, buffer, compression="snappy")
+        buffer.seek(0)
+
+        job_config = bigquery.LoadJobConfig(
+            schema=schema,
+            source_format=bigquery.SourceFormat.PARQUET,
+            write_disposition=write_disposition
+        )
+        load_job = client.load_table_from_file(
+            buffer, table_id, job_config=job_config
+        )
+        load_job.result()
+
+    def _stream_dataframe(self, client, df, table_id, schema):
+        """
+        Append a DataFrame to a BigQuery table through the Storage Write API.
+
+        Rows are sent to the table's default stream, so they are committed
+        as soon as each append succeeds.
+
+        Args:
+            client (bigquery.Client): BigQuery client
+            df (pandas.DataFrame): DataFrame to append
+            table_id (str): Full destination table ID
+            schema (list): BigQuery schema fields for the destination table
+        """
+        if self._write_client is None:
+            self._write_client = bigquery_storage_v1.BigQueryWriteClient()
+
+        # Describe the row message matching the table schema and serialize rows
+        row_proto, row_class = _row_message(schema)
+        serialized_rows = _serialize_rows(df, row_class, schema)
+
+        # Open a connection to the table's default stream
+        project, dataset_id, table_name = table_id.split(".")
+        request_template = types.AppendRowsRequest()
+        request_template.write_stream = (
+            f"{self._write_client.table_path(project, dataset_id, table_name)}"
+            "/streams/_default"
+        )
+        proto_schema = types.ProtoSchema()
+        proto_schema.proto_descriptor = row_proto
+        proto_data = types.AppendRowsRequest.ProtoData()
+        proto_data.writer_schema = proto_schema
+        request_template.proto_rows = proto_data
+        append_rows_stream = writer.AppendRowsStream(
+            self._write_client, request_template
+        )
+
+        try:
+            # Send rows in chunks and wait for every append to be acknowledged
+            futures = []
+            for i in range(0, len(serialized_rows), STREAMING_CHUNK_ROWS):
+                proto_rows = types.ProtoRows()
+                proto_rows.serialized_rows.extend(
+                    serialized_rows[i:i + STREAMING_CHUNK_ROWS]
+                )
+                proto_data = types.AppendRowsRequest.ProtoData()
+                proto_data.rows = proto_rows
+                request = types.AppendRowsRequest()
+                request.proto_rows = proto_data
+                futures.append(append_rows_stream.send(request))
+            for future in futures:
+                future.result()
+        finally:
+            append_rows_stream.close()
+
+    def _write_dataframe(self, client, df, table_id, create=False):
+        """
+        Append a DataFrame to a table, streaming small batches and loading large ones.
 
-    def save_to_database(self, df, write_mode="append"):
+        Args:
+            client (bigquery.Client): BigQuery client
+            df (pandas.DataFrame): DataFrame to append
+            table_id (str): Full destination table ID
+            create (bool): Whether the table must be created first
+        """
+        if len(df) <= STREAMING_MAX_ROWS:
+            if create:
+                client.create_table(bigquery.Table(table_id, schema=_BQ_SCHEMA))
+            self._stream_dataframe(client, df, table_id, _BQ_SCHEMA)
+        else:
+            # Load jobs create the table when needed
+            self._load_dataframe(
+                client,
+                df,
+                table_id,
+                _BQ_SCHEMA,
+                bigquery.WriteDisposition.WRITE_APPEND,
+            )
+
+    def save_to_database(self, df, write_mode="append", latest=None):
         """
         Save pollution data to BigQuery, handling overwrites per city.
 
+        The DataFrame may contain several cities; overwrite mode replaces all
+        records for every city present. New rows are staged in a temporary
+        table and then combined with the target table server-side. In append
+        mode, batches entirely newer than the stored data are written directly;
+        otherwise records that already exist are filtered out before staging
+        and the MERGE skips any that appeared since. Small batches are written
+        through the Storage Write API, larger ones through a Parquet load job.
+
         Args:
             df (pandas.DataFrame): DataFrame containing pollution data
             write_mode (str): Either 'append' or 'overwrite'
+            latest (pandas.Series, optional): Latest stored timestamp per city,
+                as returned by _latest_timestamps; queried when not given
 
         Raises:
             Exception: If there's an error saving to BigQuery
         """
         try:
-            # Create schema from configuration
-            schema = []
-            for field in BQ_CONFIG["table"]["schema"]:
-                schema.append(
-                    bigquery.SchemaField(
-                        name=field["name"],
-                        field_type=field["type"],
-                        mode=field.get("mode", "NULLABLE"),
-                        description=field.get("description", ""),
-                    )
-                )
+            client = self.client
+            table_id = self.table_id
+
+            # Get the cities we're processing
+            cities = df["city"].unique().tolist()
+
+            if write_mode == "append":
+                # Rows newer than everything stored for their city cannot
+                # collide, so they skip deduplication and go straight in
+                if latest is None:
+                    latest = self._latest_timestamps(client, table_id, cities)
+                first_new = df.groupby("city")["timestamp"].min()
+                stored = pd.to_datetime(latest.reindex(first_new.index), utc=True)
+                if (stored.isna() | (first_new > stored)).all():
+                    self._write_dataframe(client, df, table_id)
+                    return
 
-            # Initialize BigQuery client
-            client = bigquery.Client()
-            dataset_ref = client.dataset(BQ_CONFIG["dataset"]["id"])
-            table_ref = dataset_ref.table(BQ_CONFIG["table"]["id"])
-            table_id = f"{client.project}.{dataset_ref.dataset_id}.{table_ref.table_id}"
-
-            if write_mode == "overwrite":
-                # Get the city we're processing
-                city = df["city"].iloc[0]
-                
-                # Create temporary table for new data
-                temp_table_id = f"{table_id}_temp"
-                
-                # Load new data to temporary table
-                job_config = bigquery.LoadJobConfig(
-                    schema=schema,
-                    write_disposition=bigquery.WriteDisposition.WRITE_TRUNCATE
-                )
-                load_job = client.load_table_from_dataframe(
-                    df, temp_table_id, job_config=job_config
+                # Drop records that already exist so only new rows are staged
+                existing_idx = self.check_existing_records(client, table_id, df)
+                new_idx = pd.MultiIndex.from_arrays(
+                    [df["city"], df["timestamp"].dt.tz_convert(UTC)],
+                    names=["city", "timestamp"],
                 )
-                load_job.result()
-
-                # Merge data, replacing only records for the current city
-                merge_query = f"""
-                    CREATE OR REPLACE TABLE `{table_id}` AS
-                    SELECT * FROM `{table_id}`
-                    WHERE city != @city
-                    UNION ALL
-                    SELECT * FROM `{temp_table_id}`
-                """
-                
-                job_config = bigquery.QueryJobConfig(
-                    query_parameters=[
-                        bigquery.ScalarQueryParameter("city", "STRING", city)
-                    ]
-                )
-                
-                merge_job = client.query(merge_query, job_config=job_config)
-                merge_job.result()
+                df = df.loc[~new_idx.isin(existing_idx)]
 
-                # Clean up temporary table
-                client.delete_table(temp_table_id)
-
-            else:  # append mode
-                job_config = bigquery.LoadJobConfig(
-                    schema=schema,
-                    write_disposition=bigquery.WriteDisposition.WRITE_APPEND
-                )
+                if df.empty:
+                    print("All records already exist in database")
+                    return
 
-                # Get existing records for the time period
-                existing_records = self.check_existing_records(
-                    client,
-                    table_id,
-                    df["city"].iloc[0],
-                    df["timestamp"].min(),
-                    df["timestamp"].max(),
-                )
+            # Create temporary table for new data
+            temp_table_id = f"{table_id}_temp_{uuid.uuid4().hex}"
 
-                # Filter out existing records
-                df = df[
-                    ~df.apply(
-                        lambda row: (row["city"], row["timestamp"]) in existing_records,
-                        axis=1,
+            try:
+                # Load new data to temporary table
+                self._write_dataframe(client, df, temp_table_id, create=True)
+
+                if write_mode == "overwrite":
+                    # Replace only records for the current cities; MERGE keeps
+                    # the table's partitioning and clustering intact
+                    merge_query = f"""
+                        MERGE `{table_id}` T
+                        USING `{temp_table_id}` S
+                        ON FALSE
+                        WHEN NOT MATCHED BY SOURCE AND T.city IN UNNEST(@cities)
+                            THEN DELETE
+                        WHEN NOT MATCHED THEN INSERT ROW
+                    """
+
+                    job_config = bigquery.QueryJobConfig(
+                        query_parameters=[
+                            bigquery.ArrayQueryParameter("cities", "STRING", cities)
+                        ]
                     )
-                ]
 
-                if df.empty:
-                    print("All records already exist in database")
-                    return
+                    merge_job = client.query(merge_query, job_config=job_config)
+                    merge_job.result()
 
-                # Load filtered data to BigQuery
-                load_job = client.load_table_from_dataframe(
-                    df, table_ref, job_config=job_config
-                )
-                load_job.result()
+                else:  # append mode
+                    # Insert only records not already present for (city, timestamp)
+                    merge_query = f"""
+                        MERGE `{table_id}` T
+                        USING `{temp_table_id}` S
+                        ON T.city = S.city AND T.timestamp = S.timestamp
+                        WHEN NOT MATCHED THEN INSERT ROW
+                    """
+
+                    merge_job = client.query(merge_query)
+                    merge_job.result()
+
+                    if not merge_job.num_dml_affected_rows:
+                        print("All records already exist in database")
+            finally:
+                # Clean up temporary table
+                client.delete_table(temp_table_id, not_found_ok=True)
 
         except Exception as e:
             raise Exception(f"BigQuery error: {str(e)}")
 
-    def collect_data(
+    def collect_many(
         self,
-        city: str,
+        cities: list[str],
         write_mode: str = "append",
         start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None
+        end_date: Optional[datetime] = None,
+        max_workers: int = 8,
+        chunk_days: int = 30
     ):
         """
-        Collect and store pollution data for a city.
+        Collect pollution data for several cities and store it in one batch.
+
+        The date range is split into chunks of at most `chunk_days`, API
+        requests for every city and chunk are issued concurrently over the
+        shared session, and the results are saved with a single call to
+        save_to_database. In append mode without an explicit start date,
+        each city is only fetched from the hour after its latest stored
+        reading, and cities that are already up to date are skipped.
 
         Args:
-            city (str): Name of the city
+            cities (list): Names of the cities
             write_mode (str): Either 'append' or 'overwrite'
             start_date (datetime, optional): Start date for data collection
             end_date (datetime, optional): End date for data collection
+            max_workers (int): Maximum number of concurrent API requests
+            chunk_days (int): Maximum number of days covered by one API request
         """
+        # Calculate date range
+        resume = write_mode == "append" and start_date is None
+        if end_date is None:
+            end_date = datetime.now()
+        if start_date is None:
+            start_date = end_date - timedelta(days=7)
+        if start_date >= end_date:
+            print(f"Empty date range: {start_date} to {end_date}")
+            return
+
+        # Convert dates to UTC for API request
+        start_utc = start_date.astimezone(UTC)
+        end_utc = end_date.astimezone(UTC)
+
+        # Resolve coordinates and timezones sequentially (both are cached)
+        locations = {}
+        for city in cities:
+            try:
+                lat, lon = self.get_coordinates(city)
+                locations[city] = (lat, lon, self.get_timezone(lat, lon))
+            except Exception as e:
+                print(f"Error collecting data for {city}: {str(e)}")
+
+        # Persist any newly geocoded cities in a single write
         try:
-            # Calculate date range
-            if end_date is None:
-                end_date = datetime.now()
-            if start_date is None:
-                start_date = end_date - timedelta(days=7)
+            self._save_geo_cache()
+        except OSError as e:
+            print(f"Warning: Could not save geocoding cache: {str(e)}")
+
+        # Resume each city after its latest stored reading
+        starts = {city: start_utc for city in locations}
+        latest = None
+        if resume and locations:
+            try:
+                latest = self._latest_timestamps(
+                    self.client, self.table_id, list(locations)
+                )
+            except Exception as e:
+                print(f"Warning: Could not check stored data, fetching full range: {str(e)}")
+            else:
+                for city, latest_ts in latest.items():
+                    next_hour = latest_ts + timedelta(hours=1)
+                    if next_hour > end_utc:
+                        print(f"Data for {city} is already up to date")
+                        del locations[city], starts[city]
+                    else:
+                        starts[city] = max(start_utc, next_hour)
+
+        # Fetch pollution data from API concurrently, one request per chunk
+        items = {city: [] for city in locations}
+        failed = set()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    self.get_pollution_data, lat, lon, chunk_start, chunk_end
+                ): city
+                for city, (lat, lon, _) in locations.items()
+                for chunk_start, chunk_end in _chunk_ranges(
+                    starts[city], end_utc, chunk_days
+                )
+            }
+            for future in as_completed(futures):
+                city = futures[future]
+                try:
+                    items[city].extend(future.result()["list"])
+                except Exception as e:
+                    if city not in failed:
+                        print(f"Error collecting data for {city}: {str(e)}")
+                    failed.add(city)
+
+        frames = []
+        for city, city_items in items.items():
+            if city in failed:
+                continue
+
+            try:
+                # Parse API response into DataFrame with city's timezone
+                df = self.parse_pollution_data(
+                    {"list": city_items}, city, locations[city][2], starts[city]
+                )
+            except Exception as e:
+                print(f"Error collecting data for {city}: {str(e)}")
+                continue
 
-            # Get city coordinates and timezone
-            lat, lon = self.get_coordinates(city)
-            timezone = self.get_timezone(lat, lon)
+            if df.empty:
+                print(f"No data collected for {city}")
+                continue
 
-            # Convert dates to UTC for API request
-            start_utc = start_date.astimezone(pytz.UTC)
-            end_utc = end_date.astimezone(pytz.UTC)
+            # Normalize to UTC so frames from different timezones concatenate
+            df["timestamp"] = df["timestamp"].dt.tz_convert(UTC)
+            frames.append(df)
 
-            # Fetch pollution data from API
-            pollution_data = self.get_pollution_data(lat, lon, start_utc, end_utc)
+        if not frames:
+            return
 
-            # Parse API response into DataFrame with city's timezone
-            df = self.parse_pollution_data(pollution_data, city, timezone)
+        try:
+            # Save all cities to BigQuery in one batch
+            df = pd.concat(frames, ignore_index=True)
+            self.save_to_database(df, write_mode, latest)
 
-            if df.empty:
-                print(f"No data collected for {city}")
-                return
+            print(f"Successfully collected and stored {len(df)} records for {len(frames)} cities")
+            print(f"Date range: {start_date} to {end_date}")
 
-            # Save data to BigQuery
-            self.save_to_database(df, write_mode)
+        except Exception as e:
+            print(f"Error storing data for {', '.join(locations)}: {str(e)}")
 
-            print(f"Successfully collected and stored {len(df)} records for {city}")
-            print(f"Date range: {start_date} to {end_date} ({timezone})")
+    def collect_data(
+        self,
+        city: str,
+        write_mode: str = "append",
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        chunk_days: int = 30
+    ):
+        """
+        Collect and store pollution data for a city.
 
-        except Exception as e:
-            print(f"Error collecting data for {city}: {str(e)}")
+        Args:
+            city (str): Name of the city
+            write_mode (str): Either 'append' or 'overwrite'
+            start_date (datetime, optional): Start date for data collection
+            end_date (datetime, optional): End date for data collection
+            chunk_days (int): Maximum number of days covered by one API request
+        """
+        self.collect_many(
+            [city], write_mode, start_date, end_date, chunk_days=chunk_days
+        )
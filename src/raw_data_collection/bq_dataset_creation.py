@@ -55,6 +55,15 @@ def create_bigquery_dataset(config):
         # Create the air pollution table with schema
         table_id = f"{dataset_ref}.{config['table']['id']}"
         table = bigquery.Table(table_id, schema=schema)
+
+        # Partition by day and cluster so per-city time-range scans are pruned
+        partitioning = config['table'].get('partitioning')
+        if partitioning:
+            table.time_partitioning = bigquery.TimePartitioning(
+                type_=partitioning.get('type', 'DAY'),
+                field=partitioning['field']
+            )
+        table.clustering_fields = config['table'].get('clustering_fields')
         table = client.create_table(table, exists_ok=True)
         print(f"Table {table_id} created or already exists.")
         
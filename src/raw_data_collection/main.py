@@ -5,17 +5,36 @@ This script orchestrates the collection of air pollution data for all configured
 """
 
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
 import yaml
 
+from src.utils.bq_utils import YAML_LOADER
+
 from .air_pollution_collector import AirPollutionCollector
 
 
+@lru_cache(maxsize=1)
+def load_cities(path: str = "config/cities.yml") -> tuple:
+    """
+    Load the city list from the configuration file, parsing it only once.
+
+    Args:
+        path (str): Path to the cities configuration file
+
+    Returns:
+        tuple: City configuration entries
+    """
+    with open(path, "rb") as f:
+        return tuple(yaml.load(f, Loader=YAML_LOADER)["cities"])
+
+
 def collect_all_cities(
     write_mode: str = "append",
     start_date: Optional[datetime] = None,
-    end_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None,
+    max_workers: int = 10
 ):
     """
     Collect data for all configured cities.
@@ -24,25 +43,25 @@ def collect_all_cities(
         write_mode (str): Either 'append' or 'overwrite'
         start_date (datetime, optional): Start date for data collection
         end_date (datetime, optional): End date for data collection
+        max_workers (int): Maximum number of concurrent API requests
     """
     # Initialize collector
     collector = AirPollutionCollector()
 
     try:
         # Load city list from configuration file
-        with open("config/cities.yml", "r", encoding="utf-8") as f:
-            cities_config = yaml.safe_load(f)["cities"]
+        cities_config = load_cities()
 
         print(f"Starting data collection at {datetime.now()}")
         print(f"Found {len(cities_config)} cities in configuration")
         if start_date and end_date:
             print(f"Collecting data from {start_date} to {end_date}")
 
-        # Collect data for each city
-        for i, city_data in enumerate(cities_config, 1):
-            city_name = city_data["name"]
-            print(f"\nProcessing city {i}/{len(cities_config)}: {city_name}")
-            collector.collect_data(city_name, write_mode, start_date, end_date)
+        # Collect data for all cities in a single batch
+        city_names = [city_data["name"] for city_data in cities_config]
+        collector.collect_many(
+            city_names, write_mode, start_date, end_date, max_workers=max_workers
+        )
 
         print(f"\nCompleted data collection at {datetime.now()}")
 
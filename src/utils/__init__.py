@@ -5,6 +5,14 @@ This package provides shared utilities and helper functions used across
 the air pollution dashboard application.
 """
 
-from .bq_utils import BQ_CONFIG, load_bq_config, load_environment
+from . import bq_utils
+from .bq_utils import load_bq_config, load_environment
 
-__all__ = ['BQ_CONFIG', 'load_bq_config', 'load_environment'] 
\ No newline at end of file
+__all__ = ['BQ_CONFIG', 'load_bq_config', 'load_environment']
+
+
+def __getattr__(name):
+    """Forward BQ_CONFIG to bq_utils so it is only loaded when used."""
+    if name == "BQ_CONFIG":
+        return bq_utils.BQ_CONFIG
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}") 
\ No newline at end of file
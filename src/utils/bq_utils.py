@@ -7,6 +7,7 @@ including configuration loading and environment setup.
 
 import os
 import warnings
+from functools import lru_cache
 from pathlib import Path
 
 import yaml
@@ -16,6 +17,9 @@ from google.cloud import bigquery
 # Get project root directory
 PROJECT_ROOT = Path(__file__).parent.parent.parent.resolve()
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def load_bq_config():
     """
@@ -33,13 +37,17 @@ def load_bq_config():
         raise FileNotFoundError(f"BigQuery config file not found at {config_path}")
 
     with open(config_path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=YAML_LOADER)
 
 
+@lru_cache(maxsize=1)
 def load_environment():
     """
     Load environment variables from .env file.
 
+    The file is read and validated once per process; later calls return
+    immediately. A failed validation raises and is retried on the next call.
+
     Returns:
         dict: Dictionary containing required environment variables
 
@@ -84,5 +92,23 @@ def get_bigquery_client():
     return bigquery.Client(project=project_id)
 
 
-# Load configuration once at module level
-BQ_CONFIG = load_bq_config()
+def __getattr__(name):
+    """
+    Load BQ_CONFIG on first access instead of at import time.
+
+    The parsed configuration is stored as a module global, so later
+    lookups no longer reach this function.
+
+    Args:
+        name (str): Attribute name
+
+    Returns:
+        dict: BigQuery configuration when ``name`` is ``"BQ_CONFIG"``
+
+    Raises:
+        AttributeError: For any other attribute
+    """
+    if name == "BQ_CONFIG":
+        config = globals()["BQ_CONFIG"] = load_bq_config()
+        return config
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
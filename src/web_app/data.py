@@ -1,10 +1,30 @@
 """Data fetching module for the Streamlit app."""
 
+import pandas as pd
 import streamlit as st
 from google.oauth2 import service_account
-from google.cloud import bigquery
+from google.cloud import bigquery, bigquery_storage
+from utils import load_pollutant_config
 
+# Load pollutant configuration
+POLLUTANT_INFO = load_pollutant_config()
 
+
+@st.cache_resource
+def get_credentials():
+    """
+    Create service account credentials from Streamlit secrets.
+
+    Returns:
+        google.oauth2.service_account.Credentials: Service account credentials
+    """
+    # Create credentials from the service account TOML file
+    return service_account.Credentials.from_service_account_info(
+        st.secrets.gcp_service_account
+    )
+
+
+@st.cache_resource
 def get_bigquery_client():
     """
     Create a BigQuery client using project ID from environment.
@@ -13,67 +33,173 @@ def get_bigquery_client():
         google.cloud.bigquery.Client: Configured BigQuery client
 
     Note:
-        Uses BIGQUERY_PROJECT_ID from environment variables or Streamlit secrets
+        Uses BIGQUERY_PROJECT_ID from environment variables or Streamlit secrets.
+        The client is cached for the lifetime of the process and shared by all
+        sessions; it is thread-safe and never mutated.
     """
-    # Create credentials from the service account TOML file
-    credentials = service_account.Credentials.from_service_account_info(
-        st.secrets.gcp_service_account
-    )
+    credentials = get_credentials()
     project_id = credentials.project_id
 
     return bigquery.Client(credentials=credentials, project=project_id)
 
 
-@st.cache_data(ttl=3600)
-def get_annual_means():
-    """Fetch annual mean data from BigQuery."""
+@st.cache_resource
+def get_bqstorage_client():
+    """
+    Create the BigQuery Storage Read API client.
+
+    Returns:
+        google.cloud.bigquery_storage.BigQueryReadClient: Storage Read API client
+    """
+    return bigquery_storage.BigQueryReadClient(credentials=get_credentials())
+
+
+def _compact_dtypes(df):
+    """
+    Shrink query results before they are cached and plotted.
+
+    Concentrations are stored with two decimals, so float32 is lossless for
+    display; timestamps are hourly, so second resolution is enough.
+
+    Args:
+        df (pandas.DataFrame): Query results
+
+    Returns:
+        pandas.DataFrame: Results with float32, datetime64[s] and category columns
+    """
+    for col in df.select_dtypes("float64"):
+        df[col] = pd.to_numeric(df[col], downcast="float")
+    if "timestamp" in df:
+        df["timestamp"] = df["timestamp"].astype("datetime64[s, UTC]")
+    if "city" in df:
+        df["city"] = df["city"].astype("category")
+    return df
+
+
+def _run_query(query, job_config=None):
+    """
+    Run a query against BigQuery's result cache and download the results
+    as Arrow record batches.
+
+    Args:
+        query (str): SQL query
+        job_config (bigquery.QueryJobConfig, optional): Query configuration
+
+    Returns:
+        pandas.DataFrame: Query results with compact dtypes
+    """
+    # Serve repeated queries from BigQuery's result cache
+    job_config = job_config or bigquery.QueryJobConfig()
+    job_config.use_query_cache = True
+    job_config.use_legacy_sql = False
+
     client = get_bigquery_client()
-    query = """
-    SELECT *
+    df = client.query(query, job_config=job_config).to_dataframe(
+        bqstorage_client=get_bqstorage_client()
+    )
+    return _compact_dtypes(df)
+
+
+def _cities_parameter(cities):
+    """
+    Build the query parameter restricting results to the plotted cities.
+
+    Args:
+        cities (tuple): City names
+
+    Returns:
+        bigquery.ArrayQueryParameter: STRING array parameter named ``cities``
+    """
+    return bigquery.ArrayQueryParameter("cities", "STRING", list(cities))
+
+
+# Fetched in worker threads; the page shows its own spinner
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False)
+def get_annual_means(pollutant, cities):
+    """Fetch annual mean data for a pollutant and the given cities."""
+    col = POLLUTANT_INFO[pollutant]["annual_col"]
+    query = f"""
+    SELECT city, year, {col}
     FROM `air_pollution_staging.stg_annual_mean`
+    WHERE city IN UNNEST(@cities)
     ORDER BY city, year
     """
-    return client.query(query).to_dataframe()
+    job_config = bigquery.QueryJobConfig(
+        query_parameters=[_cities_parameter(cities)]
+    )
+    return _run_query(query, job_config)
 
 
-@st.cache_data(ttl=3600)
-def get_rolling_means(start_date, end_date):
-    """Fetch rolling mean data for the specified date range."""
-    client = get_bigquery_client()
-    query = """
-    SELECT *
+# Fetched in worker threads; the page shows its own spinner
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False)
+def get_rolling_means(pollutant, cities, start_date, end_date):
+    """
+    Fetch a pollutant's rolling mean data for whole days.
+
+    Taking dates rather than datetimes keys the cache on
+    (pollutant, cities, start day, end day), so every session viewing the
+    same window shares one entry.
+
+    Args:
+        pollutant (str): Pollutant name
+        cities (tuple): City names
+        start_date (datetime.date): First day to include
+        end_date (datetime.date): Last day to include
+
+    Returns:
+        pandas.DataFrame: city, timestamp, the pollutant's rolling mean
+            column and data_completeness_pct
+    """
+    col = POLLUTANT_INFO[pollutant]["rolling_col"]
+    query = f"""
+    SELECT city, timestamp, {col}, data_completeness_pct
     FROM `air_pollution_staging.stg_rolling_24h_mean`
-    WHERE timestamp BETWEEN @start_date AND @end_date
+    WHERE timestamp >= TIMESTAMP(@start_date)
+        AND timestamp < TIMESTAMP(DATE_ADD(@end_date, INTERVAL 1 DAY))
+        AND city IN UNNEST(@cities)
     ORDER BY city, timestamp
     """
     job_config = bigquery.QueryJobConfig(
         query_parameters=[
-            bigquery.ScalarQueryParameter("start_date", "TIMESTAMP", start_date),
-            bigquery.ScalarQueryParameter("end_date", "TIMESTAMP", end_date),
+            bigquery.ScalarQueryParameter("start_date", "DATE", start_date),
+            bigquery.ScalarQueryParameter("end_date", "DATE", end_date),
+            _cities_parameter(cities),
         ]
     )
-    return client.query(query, job_config=job_config).to_dataframe()
+    return _run_query(query, job_config)
 
 
-@st.cache_data(ttl=3600)
-def get_o3_peak_season():
-    """Fetch ozone peak season data."""
-    client = get_bigquery_client()
-    query = """
-    SELECT *
-    FROM `air_pollution_staging.stg_o3_peak_season`
-    ORDER BY city, date
+@st.cache_data(ttl=3600, max_entries=32)
+def get_o3_data(cities):
     """
-    return client.query(query).to_dataframe()
+    Fetch ozone peak season and 8-hour rolling max data in one query.
 
+    Both tables share the same columns, so they are combined with UNION ALL
+    and split again on a discriminator column.
 
-@st.cache_data(ttl=3600)
-def get_o3_rolling():
-    """Fetch ozone 8-hour rolling max data."""
-    client = get_bigquery_client()
+    Args:
+        cities (tuple): City names
+
+    Returns:
+        tuple: (peak season DataFrame, rolling max DataFrame)
+    """
     query = """
-    SELECT *
+    SELECT 'peak_season' AS kind, city, date, daily_max_o3_8h
+    FROM `air_pollution_staging.stg_o3_peak_season`
+    WHERE city IN UNNEST(@cities)
+    UNION ALL
+    SELECT 'rolling' AS kind, city, date, daily_max_o3_8h
     FROM `air_pollution_staging.stg_o3_8h_rolling`
-    ORDER BY city, date
+    WHERE city IN UNNEST(@cities)
+    ORDER BY kind, city, date
     """
-    return client.query(query).to_dataframe()
+    job_config = bigquery.QueryJobConfig(
+        query_parameters=[_cities_parameter(cities)]
+    )
+    df = _run_query(query, job_config)
+
+    # Split the combined result back into one frame per table
+    is_peak_season = df["kind"] == "peak_season"
+    peak_season = df[is_peak_season].drop(columns="kind").reset_index(drop=True)
+    rolling = df[~is_peak_season].drop(columns="kind").reset_index(drop=True)
+    return peak_season, rolling
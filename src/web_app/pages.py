@@ -1,13 +1,15 @@
 """Page rendering functions for the Streamlit app."""
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 from data import (
     get_annual_means,
-    get_o3_peak_season,
-    get_o3_rolling,
+    get_o3_data,
     get_rolling_means,
 )
 from plots import (
@@ -18,8 +20,29 @@ from plots import (
 )
 from utils import load_cities, load_pollutant_config
 
-# Load pollutant configuration
+# Load pollutant and city configuration
 POLLUTANT_INFO = load_pollutant_config()
+CITIES = load_cities()
+
+
+def _fetch_concurrently(*calls):
+    """
+    Run independent data fetches in parallel threads.
+
+    Args:
+        *calls: ``(function, *args)`` tuples, one per fetch
+
+    Returns:
+        list: Results in the same order as ``calls``
+    """
+    # Attach the current script context so cached fetchers work in workers
+    ctx = get_script_run_ctx()
+    with ThreadPoolExecutor(
+        max_workers=len(calls),
+        initializer=lambda: add_script_run_ctx(threading.current_thread(), ctx),
+    ) as executor:
+        futures = [executor.submit(func, *args) for func, *args in calls]
+        return [future.result() for future in futures]
 
 
 def render_landing_page():
@@ -46,15 +69,14 @@ def render_landing_page():
     
     # Add data overview
     st.subheader("Current Data Coverage")
-    cities = load_cities()
 
     col1, col2 = st.columns(2)
 
     with col1:
         st.markdown("#### Monitored Cities")
         st.markdown(f"""
-        - Total cities: **{len(cities)}**
-        - Locations: {', '.join(cities)}
+        - Total cities: **{len(CITIES)}**
+        - Locations: {', '.join(CITIES)}
         """)
 
     with col2:
@@ -90,23 +112,19 @@ def render_pollutant_page(pollutant):
     Args:
         pollutant (str): Name of the pollutant
     """
+    info = POLLUTANT_INFO[pollutant]
+
     st.header(f"{pollutant} Concentrations")
 
     # Show pollutant description
     with st.expander("About this pollutant"):
-        st.markdown(POLLUTANT_INFO[pollutant]["description"])
+        st.markdown(info["description"])
 
-    # For pollutants with annual means (PM2.5, PM10, NO2)
-    if "annual_col" in POLLUTANT_INFO[pollutant]:
-        # Fetch and display annual data
-        with st.spinner("Loading annual means..."):
-            annual_data = get_annual_means()
-
-        st.subheader("Annual Mean Concentrations")
-        st.plotly_chart(
-            plot_annual_means(annual_data, pollutant, load_cities()),
-            use_container_width=True,
-        )
+    # For pollutants with annual means (PM2.5, PM10, NO2), reserve a slot
+    # above the date inputs that is filled once both fetches complete
+    has_annual = "annual_col" in info
+    if has_annual:
+        annual_section = st.container()
 
     # For all pollutants - show rolling means
     st.subheader("24-hour Rolling Mean Concentrations")
@@ -128,28 +146,39 @@ def render_pollutant_page(pollutant):
             key=f"{pollutant}_end_date",
         )
 
-    # Convert dates to datetime
-    start_datetime = datetime.combine(start_date, datetime.min.time())
-    end_datetime = datetime.combine(end_date, datetime.max.time())
-
-    # Update rolling means data based on selection
-    with st.spinner("Loading rolling means..."):
-        rolling_data = get_rolling_means(start_datetime, end_datetime)
+    # Fetch annual and rolling means in parallel; the rolling means are
+    # keyed on the selected days, so repeated selections hit the cache
+    calls = [(get_rolling_means, pollutant, CITIES, start_date, end_date)]
+    if has_annual:
+        calls.append((get_annual_means, pollutant, CITIES))
+    with st.spinner("Loading data..."):
+        rolling_data, *annual_result = _fetch_concurrently(*calls)
+
+    if has_annual:
+        with annual_section:
+            st.subheader("Annual Mean Concentrations")
+            st.plotly_chart(
+                plot_annual_means(annual_result[0], pollutant, CITIES),
+                use_container_width=True,
+            )
 
     if rolling_data.empty:
         st.warning("No data available for the selected date range.")
     else:
         # Display rolling means chart
         st.plotly_chart(
-            plot_rolling_means(rolling_data, pollutant, load_cities()),
+            plot_rolling_means(rolling_data, pollutant, CITIES),
             use_container_width=True,
         )
 
         # Add data quality information
+        stats = rolling_data.agg(
+            {"timestamp": ["min", "max"], "data_completeness_pct": "mean"}
+        )
         st.subheader("Data Quality")
         st.markdown(f"""
-        - Date range: {rolling_data['timestamp'].min()} to {rolling_data['timestamp'].max()}
-        - Data completeness: {rolling_data['data_completeness_pct'].mean():.1f}% average
+        - Date range: {stats.at['min', 'timestamp']} to {stats.at['max', 'timestamp']}
+        - Data completeness: {stats.at['mean', 'data_completeness_pct']:.1f}% average
         """)
 
 
@@ -161,34 +190,35 @@ def render_o3_page():
     with st.expander("About this pollutant"):
         st.markdown(POLLUTANT_INFO["O3"]["description"])
 
+    # Fetch peak season and rolling maximum data in a single query
+    with st.spinner("Loading ozone data..."):
+        peak_season_data, rolling_data = get_o3_data(CITIES)
+
     # Peak Season Analysis
     st.subheader("Peak Season Analysis")
-    with st.spinner("Loading peak season data..."):
-        peak_season_data = get_o3_peak_season()
 
     if peak_season_data.empty:
         st.warning("No peak season data available.")
     else:
         st.plotly_chart(
-            plot_o3_peak_season(peak_season_data, load_cities()),
+            plot_o3_peak_season(peak_season_data, CITIES),
             use_container_width=True,
         )
 
     # 8-hour Rolling Maximum
     st.subheader("8-hour Rolling Maximum")
-    with st.spinner("Loading rolling maximum data..."):
-        rolling_data = get_o3_rolling()
 
     if rolling_data.empty:
         st.warning("No rolling maximum data available.")
     else:
         st.plotly_chart(
-            plot_o3_rolling(rolling_data, load_cities()), use_container_width=True
+            plot_o3_rolling(rolling_data, CITIES), use_container_width=True
         )
 
         # Add data quality information
+        stats = rolling_data["date"].agg(["min", "max", "size"])
         st.subheader("Data Quality")
         st.markdown(f"""
-        - Date range: {rolling_data['date'].min()} to {rolling_data['date'].max()}
-        - Number of measurements: {len(rolling_data)}
+        - Date range: {stats['min']} to {stats['max']}
+        - Number of measurements: {stats['size']}
         """)
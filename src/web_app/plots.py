@@ -2,11 +2,19 @@
 
 import plotly.express as px
 import plotly.graph_objects as go
+from plotly.subplots import make_subplots
 from utils import load_pollutant_config
 
 # Load pollutant configuration
 POLLUTANT_INFO = load_pollutant_config()
 
+# Hover format shared by every O3 trace
+O3_HOVERTEMPLATE = (
+    "Date: %{x}<br>"
+    "O₃: %{y:.1f} μg/m³<br>"
+    "<extra></extra>"
+)
+
 def plot_annual_means(df, pollutant, cities):
     """
     Create a bar chart for annual means with reference lines.
@@ -19,41 +27,66 @@ def plot_annual_means(df, pollutant, cities):
     Returns:
         plotly.graph_objects.Figure: The plotted figure
     """
-    col = POLLUTANT_INFO[pollutant]["annual_col"]
+    info = POLLUTANT_INFO[pollutant]
+    col = info["annual_col"]
+    unit = info["unit"]
     
-    # Create the bar chart with reduced opacity
-    fig = px.bar(
-        df,
-        x="city",
-        y=col,
-        facet_col="year",
-        title=f"Annual Mean {pollutant} Concentrations by City",
-        labels={
-            col: f'Concentration ({POLLUTANT_INFO[pollutant]["unit"]})',
-            "city": "City",
-            "year": "Year",
-        },
-        opacity=0.7
+    # One subplot per year, with cities in a stable order on each x-axis
+    df = df.sort_values("city")
+    year_groups = list(df.groupby("year", sort=True))
+    fig = make_subplots(
+        rows=1,
+        cols=max(len(year_groups), 1),
+        shared_yaxes=True,
+        subplot_titles=[f"Year={year}" for year, _ in year_groups],
     )
     
-    # Add reference line
-    reference_value = POLLUTANT_INFO[pollutant]["annual_ref"]
-    
-    # Add a horizontal line to each subplot
-    for i in range(len(fig.data)):
-        fig.add_hline(
-            y=reference_value,
-            line_dash="dash",
-            line_color="red",
-            annotation_text=f"WHO Guideline: {reference_value} {POLLUTANT_INFO[pollutant]['unit']}",
-            annotation_position="top right",
-            line_width=1.5,
-            opacity=0.9,
+    # Create the bars with reduced opacity
+    for i, (year, year_data) in enumerate(year_groups):
+        fig.add_trace(
+            go.Bar(
+                x=year_data["city"].to_numpy(),
+                y=year_data[col].to_numpy(),
+                name=str(year),
+                marker_color="#636EFA",  # Same colour in every subplot
+                opacity=0.7,
+                hovertemplate=(
+                    f"City=%{{x}}<br>Year={year}<br>"
+                    f"Concentration ({unit})=%{{y}}<extra></extra>"
+                )
+            ),
             row=1,
             col=i + 1
         )
     
+    # Add reference line
+    reference_value = info["annual_ref"]
+    
+    # Add a horizontal line across all subplots at once
+    fig.add_hline(
+        y=reference_value,
+        line_dash="dash",
+        line_color="red",
+        annotation_text=f"WHO Guideline: {reference_value} {unit}",
+        annotation_position="top right",
+        line_width=1.5,
+        opacity=0.9,
+        row="all",
+        col="all"
+    )
+    
+    # List the same cities in the same order in every year, and link the
+    # other years' x-axes to the first one as the facet layout did
+    fig.update_xaxes(
+        title_text="City",
+        categoryorder="array",
+        categoryarray=df["city"].unique().tolist(),
+    )
+    for i in range(1, len(year_groups)):
+        fig.update_xaxes(matches="x", row=1, col=i + 1)
+    fig.update_yaxes(title_text=f"Concentration ({unit})", row=1, col=1)
     fig.update_layout(
+        title=f"Annual Mean {pollutant} Concentrations by City",
         height=500,
         showlegend=False,
         margin=dict(t=50),
@@ -77,35 +110,35 @@ def plot_rolling_means(df, pollutant, cities):
     Returns:
         plotly.graph_objects.Figure: The plotted figure
     """
-    col = POLLUTANT_INFO[pollutant]["rolling_col"]
-    
-    fig = go.Figure()
+    info = POLLUTANT_INFO[pollutant]
+    col = info["rolling_col"]
+    unit = info["unit"]
+    hovertemplate = (
+        "Date: %{x}<br>"
+        f"{pollutant}: %{{y:.1f}} {unit}<br>"
+        "<extra></extra>"
+    )
     
-    # Create traces in order of cities list
-    for city in cities:
-        if city in df['city'].unique():
-            city_data = df[df['city'] == city]
-            fig.add_trace(go.Scatter(
-                x=city_data['timestamp'],
-                y=city_data[col],
-                name=city,
-                mode='lines',
-                hovertemplate=(
-                    "Date: %{x}<br>"
-                    f"{pollutant}: %{{y:.1f}} {POLLUTANT_INFO[pollutant]['unit']}<br>"
-                    "<extra></extra>"
-                )
-            ))
+    # One trace per city, with legend order following the cities list;
+    # WebGL is used automatically for traces with many points
+    fig = px.line(
+        df[df['city'].isin(cities)],
+        x='timestamp',
+        y=col,
+        color='city',
+        category_orders={'city': list(cities)},
+    )
+    fig.update_traces(hovertemplate=hovertemplate)
     
     # Add reference line
-    reference_value = POLLUTANT_INFO[pollutant]["daily_ref"]
+    reference_value = info["daily_ref"]
     
     fig.add_hline(
         y=reference_value,
         line_dash="dash",
         line_color="red",
         annotation=dict(
-            text=f"WHO Guideline: {reference_value} {POLLUTANT_INFO[pollutant]['unit']}",
+            text=f"WHO Guideline: {reference_value} {unit}",
             xanchor="right",
             x=1,
             yanchor="bottom",
@@ -119,7 +152,7 @@ def plot_rolling_means(df, pollutant, cities):
     fig.update_layout(
         title=f"24-hour Rolling Mean {pollutant} Concentrations",
         xaxis_title="Date",
-        yaxis_title=f"Concentration ({POLLUTANT_INFO[pollutant]['unit']})",
+        yaxis_title=f"Concentration ({unit})",
         height=600,
         showlegend=True,
         legend_title_text="City",
@@ -139,40 +172,36 @@ def plot_o3_peak_season(df, cities):
     Returns:
         plotly.graph_objects.Figure: The plotted figure
     """
-    fig = go.Figure()
-    
-    # Create traces in order of cities list
-    for city in cities:
-        if city in df['city'].unique():
-            city_data = df[df['city'] == city]
-            fig.add_trace(go.Scatter(
-                x=city_data['date'],
-                y=city_data['daily_max_o3_8h'],
-                name=city,
-                mode='markers',
-                marker=dict(
-                    size=8,
-                    opacity=0.7,
-                    line=dict(width=1, color='white')
-                ),
-                hovertemplate=(
-                    "Date: %{x}<br>"
-                    "O₃: %{y:.1f} μg/m³<br>"
-                    "<extra></extra>"
-                )
-            ))
+    # One marker trace per city, with legend order following the cities list
+    fig = px.scatter(
+        df[df['city'].isin(cities)],
+        x='date',
+        y='daily_max_o3_8h',
+        color='city',
+        category_orders={'city': list(cities)},
+    )
+    fig.update_traces(
+        marker=dict(
+            size=8,
+            opacity=0.7,
+            line=dict(width=1, color='white')
+        ),
+        hovertemplate=O3_HOVERTEMPLATE
+    )
     
     # Add reference line
+    reference_value = POLLUTANT_INFO["O3"]["peak_season_ref"]
+
     fig.add_hline(
-        y=POLLUTANT_INFO["O3"]["peak_season_ref"],
+        y=reference_value,
         line_dash="dash",
         line_color="red",
         annotation=dict(
-            text=f"WHO Guideline: {POLLUTANT_INFO['O3']['peak_season_ref']} μg/m³",
+            text=f"WHO Guideline: {reference_value} μg/m³",
             xanchor="right",
             x=1,
             yanchor="bottom",
-            y=POLLUTANT_INFO["O3"]["peak_season_ref"],
+            y=reference_value,
             font=dict(color="rgba(0,0,0,0.8)")
         ),
         line_width=1.5,
@@ -212,35 +241,29 @@ def plot_o3_rolling(df, cities):
     Returns:
         plotly.graph_objects.Figure: The plotted figure
     """
-    fig = go.Figure()
-    
-    # Create traces in order of cities list
-    for city in cities:
-        if city in df['city'].unique():
-            city_data = df[df['city'] == city]
-            fig.add_trace(go.Scatter(
-                x=city_data['date'],
-                y=city_data['daily_max_o3_8h'],
-                name=city,
-                mode='lines',
-                hovertemplate=(
-                    "Date: %{x}<br>"
-                    "O₃: %{y:.1f} μg/m³<br>"
-                    "<extra></extra>"
-                )
-            ))
+    # One trace per city, with legend order following the cities list
+    fig = px.line(
+        df[df['city'].isin(cities)],
+        x='date',
+        y='daily_max_o3_8h',
+        color='city',
+        category_orders={'city': list(cities)},
+    )
+    fig.update_traces(hovertemplate=O3_HOVERTEMPLATE)
     
     # Add reference line
+    reference_value = POLLUTANT_INFO["O3"]["rolling_ref"]
+
     fig.add_hline(
-        y=POLLUTANT_INFO["O3"]["rolling_ref"],
+        y=reference_value,
         line_dash="dash",
         line_color="red",
         annotation=dict(
-            text=f"WHO Guideline: {POLLUTANT_INFO['O3']['rolling_ref']} μg/m³",
+            text=f"WHO Guideline: {reference_value} μg/m³",
             xanchor="right",
             x=1,
             yanchor="bottom",
-            y=POLLUTANT_INFO["O3"]["rolling_ref"],
+            y=reference_value,
             font=dict(color="rgba(0,0,0,0.8)")
         ),
         line_width=1.5,
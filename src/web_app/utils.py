@@ -1,26 +1,41 @@
 """Utility functions for the Streamlit app."""
 
 import yaml
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 
 # Get project root directory
 PROJECT_ROOT = Path(__file__).parent.parent.parent.resolve()
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+def _freeze(value):
+    """Recursively convert dicts and lists into read-only equivalents."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+@lru_cache(maxsize=1)
 def load_cities():
-    """Load city list from configuration file."""
+    """Load city list from configuration file, parsing it once per process."""
     config_path = PROJECT_ROOT / "config" / "cities.yml"
     with open(config_path, "r", encoding="utf-8") as f:
-        config = yaml.safe_load(f)
-    return [city["name"] for city in config["cities"]]
+        config = yaml.load(f, Loader=YAML_LOADER)
+    return tuple(city["name"] for city in config["cities"])
 
+@lru_cache(maxsize=1)
 def load_pollutant_config():
     """
-    Load pollutant configuration from YAML file.
+    Load pollutant configuration from YAML file, parsing it once per process.
     
     Returns:
-        dict: Pollutant configuration dictionary
+        Mapping: Read-only pollutant configuration mapping
     """
     config_path = PROJECT_ROOT / "config" / "pollutants.yml"
     with open(config_path, "r", encoding="utf-8") as f:
-        config = yaml.safe_load(f)
-    return config["pollutants"] 
\ No newline at end of file
+        config = yaml.load(f, Loader=YAML_LOADER)
+    return _freeze(config["pollutants"])
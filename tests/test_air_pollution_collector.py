@@ -0,0 +1,90 @@
+"""Offline tests for the air pollution collector's parsing and serialization."""
+
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+import pytest
+
+from src.raw_data_collection.air_pollution_collector import (
+    _BQ_SCHEMA,
+    AirPollutionCollector,
+    _row_message,
+    _serialize_rows,
+)
+
+
+@pytest.mark.parametrize("unit", ["s", "us", "ns"])
+def test_serialize_rows_sends_timestamps_as_epoch_microseconds(unit):
+    """Timestamps serialize to microseconds whatever unit pandas stores."""
+    timestamps = pd.to_datetime([1700003600, 1700007200], unit="s", utc=True)
+    df = pd.DataFrame(
+        {
+            "city": ["Berlin", "Berlin"],
+            "timestamp": timestamps.as_unit(unit).tz_convert("Europe/Berlin"),
+            "aqi": pd.array([2, None], dtype="Int8"),
+            "co": [201.94, float("nan")],
+        }
+    ).reindex(columns=[field.name for field in _BQ_SCHEMA])
+
+    _, row_class = _row_message(_BQ_SCHEMA)
+    rows = [
+        row_class.FromString(row)
+        for row in _serialize_rows(df, row_class, _BQ_SCHEMA)
+    ]
+
+    assert [row.timestamp for row in rows] == [
+        1700003600000000,
+        1700007200000000,
+    ]
+    assert rows[0].city == "Berlin"
+    assert rows[0].aqi == 2
+    assert rows[0].co == pytest.approx(201.94)
+
+
+def test_serialize_rows_leaves_missing_values_unset():
+    """Missing values are omitted so BigQuery stores them as NULL."""
+    df = pd.DataFrame(
+        {
+            "city": ["Berlin"],
+            "timestamp": pd.to_datetime([1700003600], unit="s", utc=True),
+            "aqi": pd.array([None], dtype="Int8"),
+        }
+    ).reindex(columns=[field.name for field in _BQ_SCHEMA])
+
+    _, row_class = _row_message(_BQ_SCHEMA)
+    (row,) = [
+        row_class.FromString(row)
+        for row in _serialize_rows(df, row_class, _BQ_SCHEMA)
+    ]
+
+    assert not row.HasField("aqi")
+    assert not row.HasField("pm2_5")
+
+
+def _api_item(dt):
+    """Build one OpenWeatherMap history entry for the given epoch second."""
+    components = ["co", "no", "no2", "o3", "so2", "pm2_5", "pm10", "nh3"]
+    return {
+        "dt": dt,
+        "main": {"aqi": 2},
+        "components": {name: 1.0 for name in components},
+    }
+
+
+def test_parse_pollution_data_fills_hours_before_first_reading():
+    """Hours between the requested start and the first reading become NULL rows."""
+    data = {"list": [_api_item(1700006400), _api_item(1700013600)]}
+    start = datetime.fromtimestamp(1700006400 - 9000, timezone.utc)
+
+    # Skip __init__, which needs credentials; parsing uses no instance state
+    collector = AirPollutionCollector.__new__(AirPollutionCollector)
+    df = collector.parse_pollution_data(
+        data, "Delhi", ZoneInfo("Asia/Kolkata"), start
+    )
+
+    expected = pd.date_range(
+        pd.Timestamp(1700006400 - 7200, unit="s", tz="UTC"), periods=5, freq="h"
+    )
+    assert (df["timestamp"].dt.tz_convert("UTC") == expected).all()
+    assert df["aqi"].isna().tolist() == [True, True, False, True, False]